@@ -1,7 +1,6 @@
 import sympy
 import numpy as np
 from qibo import matrices, hamiltonians
-import matplotlib.pyplot as plt
 
 
 def read_file(file_name, instance):
@@ -16,10 +15,15 @@ def read_file(file_name, instance):
         solution (list): list of the correct outputs of the instance for testing.
         clauses (list): list of all clauses, with the qubits each clause acts upon.
     """
-    file = open('../data3sat/{q}bit/n{q}i{i}.txt'.format(q=file_name, i=instance), 'r')
-    control = list(map(int, file.readline().split()))
-    solution = list(map(str, file.readline().split()))
-    clauses = [list(map(int, file.readline().split())) for _ in range(control[1])]
+    # Whitespace-agnostic parse: read the instance once and slice the token
+    # stream, as done in the grover3sat example.
+    with open('../data3sat/{q}bit/n{q}i{i}.txt'.format(q=file_name, i=instance), 'r') as file:
+        tokens = file.read().split()
+    control = list(map(int, tokens[:3]))
+    qubits, clause_num = control[0], control[1]
+    solution = tokens[3:3 + qubits]
+    values = list(map(int, tokens[3 + qubits:3 + qubits + 3 * clause_num]))
+    clauses = [values[i:i + 3] for i in range(0, 3 * clause_num, 3)]
     return control, solution, clauses
 
 
@@ -103,6 +107,8 @@ def plot(qubits, ground, first, gap, dt, T):
         {}_qubits_energy.png: energy evolution of the ground and first excited state.
         {}_qubits_gap_energy.png: gap evolution during the adiabatic process.
     """
+    # import lazily so that runs without --plot skip the matplotlib startup
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots()
     times = np.arange(0, T+dt, dt)
     ax.plot(times, ground, label='ground state', color='C0')
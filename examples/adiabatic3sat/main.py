@@ -94,9 +94,10 @@ def main(nqubits, instance, T, dt, solver, plot, trotter, params,
     # Perform evolution
     initial_state = np.ones(2 ** nqubits) / np.sqrt(2 ** nqubits)
     final_state = evolve(final_time=T, initial_state=initial_state)
-    output_dec = (np.abs(final_state.numpy())**2).argmax()
+    probs = np.abs(final_state.numpy())**2
+    output_dec = probs.argmax()
     max_output = "{0:0{bits}b}".format(output_dec, bits = nqubits)
-    max_prob = (np.abs(final_state.numpy())**2).max()
+    max_prob = probs.max()
     print("Exact cover instance with {} qubits.\n".format(nqubits))
     if solution:
         print('Known solution: {}\n'.format(''.join(solution)))
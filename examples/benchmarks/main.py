@@ -122,6 +122,10 @@ def main(nqubits, type,
         filename (str): Name of file to write logs.
             If ``None`` logs will not be saved.
     """
+    # Filter out unused gate parameters once, before they are used in the
+    # logs and the circuit creation kwargs below.
+    params = {k: v for k, v in params.items() if v is not None}
+
     qibo.set_backend(backend)
     qibo.set_precision(precision)
     if device is not None:
@@ -146,7 +150,6 @@ def main(nqubits, type,
         "nshots": nshots, "fuse": fuse, "compile": compile
         })
 
-    params = {k: v for k, v in params.items() if v is not None}
     kwargs = {"nqubits": nqubits, "circuit_type": type}
     if params: kwargs["params"] = params
     if nlayers is not None: kwargs["nlayers"] = nlayers
@@ -1,6 +1,7 @@
 from qibo import gates
 from qibo.models.grover import Grover
 from qibo.models import Circuit
+import math
 import numpy as np
 from scipy.special import binom
 import argparse
@@ -16,14 +17,17 @@ def one_sum(sum_qubits):
 
 
 def sum_circuit(qubits):
-    sum_qubits = int(np.ceil(np.log2(qubits))) + 1
+    sum_qubits = int(math.ceil(math.log2(qubits))) + 1
     sum_circuit = Circuit(qubits + sum_qubits)
     sum_circuit.add(gates.X(qubits).controlled_by(0))
     sum_circuit.add(gates.X(qubits).controlled_by(1))
     sum_circuit.add(gates.X(qubits + 1).controlled_by(*[0, 1]))
 
+    # Build the one_sum sub-circuit once and remap it on each qubit instead
+    # of reconstructing the same template on every iteration.
+    one_sum_template = one_sum(sum_qubits)
     for qub in range(2, qubits):
-        sum_circuit.add(one_sum(sum_qubits).on_qubits(
+        sum_circuit.add(one_sum_template.on_qubits(
             *([qub] + list(range(qubits, qubits + sum_qubits)))))
 
     return sum_circuit
@@ -32,9 +36,11 @@ def sum_circuit(qubits):
 def oracle(qubits, num_1):
     sum = sum_circuit(qubits)
     oracle = Circuit(sum.nqubits + 1)
-    oracle.add(sum.on_qubits(*range(sum.nqubits)))
+    # reuse the same qubit-id tuple for the forward and inverse sum circuits
+    sum_qubit_ids = tuple(range(sum.nqubits))
+    oracle.add(sum.on_qubits(*sum_qubit_ids))
 
-    booleans = np.binary_repr(num_1, int(np.ceil(np.log2(qubits)) + 1))
+    booleans = np.binary_repr(num_1, int(math.ceil(math.log2(qubits)) + 1))
 
     for i, b in enumerate(booleans[::-1]):
         if b == '0':
@@ -46,7 +52,7 @@ def oracle(qubits, num_1):
         if b == '0':
             oracle.add(gates.X(qubits + i))
 
-    oracle.add(sum.invert().on_qubits(*range(sum.nqubits)))
+    oracle.add(sum.invert().on_qubits(*sum_qubit_ids))
 
     return oracle
 
@@ -9,58 +9,60 @@ from qibo.models import Grover
 def set_ancillas_to_num(ancillas, num):
     """Set a quantum register to a specific number.
     """
-    ind = 0
-    for i in reversed(bin(num)[2:]):
-        if int(i) == 1:
+    for ind in range(num.bit_length()):
+        if (num >> ind) & 1:
             yield gates.X(ancillas[ind])
-        ind += 1
 
 
 def add_negates_for_check(ancillas, num):
     """Adds the negates needed for control-on-zero.
     """
-    ind = 0
-    for i in reversed(bin(num)[2:]):
-        if int(i) == 0:
+    nbits = num.bit_length()
+    for ind in range(nbits):
+        if not (num >> ind) & 1:
             yield gates.X(ancillas[ind])
-        ind += 1
-    for i in range(len(bin(num)[2:]), len(ancillas)):
+    for i in range(nbits, len(ancillas)):
         yield gates.X(ancillas[i])
 
 
 def sub_one(ancillas, controls):
     """Subtract 1 bit by bit.
     """
-    a = ancillas
-    yield gates.X(a[0]).controlled_by(*controls)
-    for i in range(1, len(a)):
-        controls.append(a[i - 1])
-        yield gates.X(a[i]).controlled_by(*controls)
+    # Accumulate the growing control list in a local copy so the caller's
+    # list is not mutated as a side effect.
+    acc = list(controls)
+    yield gates.X(ancillas[0]).controlled_by(*acc)
+    for anc, prev in zip(ancillas[1:], ancillas):
+        acc.append(prev)
+        yield gates.X(anc).controlled_by(*acc)
 
 
 def superposition_probabilities(n, r):
     """Computes the probabilities to set the initial superposition.
     """
-
-    def split_weights(n, r):
-        """Auxiliary function that gets the required binomials.
-        """
-        v0 = binomial(n - 1, r)
-        v1 = binomial(n - 1, r - 1)
-        return v0 / (v0 + v1), v1 / (v0 + v1)
+    # Binomial table C[k, m] = binomial(k, m), built with one vectorized
+    # Pascal update per row. Replaces the two scipy scalar binom calls per
+    # (i, j) pair and stays exact, which the (0, 1) weight checks rely on.
+    C = np.zeros((n, r + 1))
+    C[:, 0] = 1
+    for k in range(1, n):
+        C[k, 1:] = C[k - 1, 1:] + C[k - 1, :r]
 
     L = []
     for i in range(n):
         for j in range(min(i, r - 1), -1, -1):
             if n - i >= r - j:
-                L.append([n - i, r - j, split_weights(n - i, r - j)])
+                v0 = C[n - i - 1, r - j]
+                v1 = C[n - i - 1, r - j - 1]
+                total = v0 + v1
+                L.append([n - i, r - j, (v0 / total, v1 / total)])
     return L
 
 
 def superposition_circuit(n, r):
     """Creates an equal quantum superposition over the column choices.
     """
-    n_anc = int(np.ceil(np.log2(r + 1)))
+    n_anc = r.bit_length()
     ancillas = [i for i in range(n, n + n_anc)]
     c = Circuit(n + n_anc)
     c.add(set_ancillas_to_num(ancillas, r))
@@ -71,16 +73,19 @@ def superposition_circuit(n, r):
             c.add(sub_one(ancillas, [n - tmp]))
             tmp = i[0]
 
+        # The negation block is identical before and after the controlled
+        # gate, so build its gate list once and add it twice.
+        negates = list(add_negates_for_check(ancillas, i[1]))
         if (i[2] == (0, 1)):
-            c.add(add_negates_for_check(ancillas, i[1]))
+            c.add(negates)
             c.add(gates.X(n - i[0]).controlled_by(*ancillas))
-            c.add(add_negates_for_check(ancillas, i[1]))
+            c.add(negates)
         else:
             if i[0] != n:
-                c.add(add_negates_for_check(ancillas, i[1]))
+                c.add(negates)
                 c.add(gates.RY(
                     n - i[0], float(2 * np.arccos(np.sqrt(i[2][0])))).controlled_by(*ancillas))
-                c.add(add_negates_for_check(ancillas, i[1]))
+                c.add(negates)
             else:
                 c.add(gates.RY(0, float(2 * np.arccos(np.sqrt(i[2][0])))))
     c.add(sub_one(ancillas, [n - 1]))
@@ -93,19 +98,21 @@ def oracle(n, s):
     if s > 2:
         n_anc = s - 2
         oracle = Circuit(n + n_anc + 1)
-        oracle_1 = Circuit(n + n_anc + 1)
-        oracle_1.add(gates.X(n + 1).controlled_by(*(0, 1)))
-        for q in range(2, s-1):
-            oracle_1.add(gates.X(n + q).controlled_by(*(q, n + q - 1)))
-
-        oracle.add(oracle_1.on_qubits(*(range(n + n_anc + 1))))
+        # Build the uncomputation chain by replaying the forward gates in
+        # reverse order (controlled-X is self-inverse), instead of wrapping
+        # them in a helper circuit and remapping it twice with ``on_qubits``
+        # plus an ``invert`` pass over the whole queue.
+        forward = [gates.X(n + 1).controlled_by(*(0, 1))]
+        forward.extend(gates.X(n + q).controlled_by(*(q, n + q - 1))
+                       for q in range(2, s - 1))
+        oracle.add(forward)
         oracle.add(gates.X(n).controlled_by(*(s - 1, n + n_anc)))
-        oracle.add(oracle_1.invert().on_qubits(*(range(n + n_anc + 1))))
+        oracle.add(reversed(forward))
 
         return oracle
 
     else:
-        oracle = Circuit(n + int(np.ceil(np.log2(s + 1))) + 1)
+        oracle = Circuit(n + s.bit_length() + 1)
         oracle.add(gates.X(n).controlled_by(*range(s)))
 
         return oracle
@@ -15,10 +15,15 @@ def read_file(file_name, instance):
         solution (list): list of the correct outputs of the instance for testing.
         clauses (list): list of all clauses, with the qubits each clause acts upon.
     """
-    file = open('../data3sat/{q}bit/n{q}i{i}.txt'.format(q=file_name, i=instance), 'r')
-    control = list(map(int, file.readline().split()))
-    solution = list(map(str, file.readline().split()))
-    clauses = [list(map(int, file.readline().split())) for _ in range(control[1])]
+    # Read the whole instance in one go and slice the token stream instead
+    # of issuing one readline/split per clause.
+    with open('../data3sat/{q}bit/n{q}i{i}.txt'.format(q=file_name, i=instance), 'r') as file:
+        tokens = file.read().split()
+    control = list(map(int, tokens[:3]))
+    qubits, clause_num = control[0], control[1]
+    solution = tokens[3:3 + qubits]
+    values = list(map(int, tokens[3 + qubits:3 + qubits + 3 * clause_num]))
+    clauses = [values[i:i + 3] for i in range(0, 3 * clause_num, 3)]
     return control, solution, clauses
 
 
@@ -69,21 +74,18 @@ def oracle(q, c, ancilla, clauses):
     Returns:
         quantum gate generator for the 3SAT oracle
     """
-    k = 0
-    for clause in clauses:
-        yield gates.CNOT(q[clause[0] - 1], c[k])
-        yield gates.CNOT(q[clause[1] - 1], c[k])
-        yield gates.CNOT(q[clause[2] - 1], c[k])
-        yield gates.X(c[k]).controlled_by(q[clause[0] - 1], q[clause[1] - 1], q[clause[2] - 1])
-        k += 1
+    # The clause checks are built once and the same gate list uncomputes the
+    # clause register after the sign flip, halving the gate construction work.
+    forward = []
+    for k, clause in enumerate(clauses):
+        q1, q2, q3 = q[clause[0] - 1], q[clause[1] - 1], q[clause[2] - 1]
+        forward.append(gates.CNOT(q1, c[k]))
+        forward.append(gates.CNOT(q2, c[k]))
+        forward.append(gates.CNOT(q3, c[k]))
+        forward.append(gates.X(c[k]).controlled_by(q1, q2, q3))
+    yield from forward
     yield gates.X(ancilla).controlled_by(*c)
-    k = 0
-    for clause in clauses:
-        yield gates.CNOT(q[clause[0] - 1], c[k])
-        yield gates.CNOT(q[clause[1] - 1], c[k])
-        yield gates.CNOT(q[clause[2] - 1], c[k])
-        yield gates.X(c[k]).controlled_by(q[clause[0] - 1], q[clause[1] - 1], q[clause[2] - 1])
-        k += 1
+    yield from forward
 
         
 def diffusion(q):
@@ -94,15 +96,17 @@ def diffusion(q):
     Returns:
         quantum gate geenrator that applies the diffusion step.
     """
-    for i in q:
-        yield gates.H(i)
-        yield gates.X(i)
+    # Build the H/X brackets around the multi-controlled X once and reuse
+    # the same gate lists to close them, instead of walking q a second time.
+    hadamards = [gates.H(i) for i in q]
+    xgates = [gates.X(i) for i in q]
+    yield from hadamards
+    yield from xgates
     yield gates.H(q[0])
-    yield gates.X(q[0]).controlled_by(*q[1:len(q)])
+    yield gates.X(q[0]).controlled_by(*q[1:])
     yield gates.H(q[0])
-    for i in q:
-        yield gates.X(i)
-        yield gates.H(i)
+    yield from xgates
+    yield from hadamards
 
 
 def grover(circuit, q, c, ancilla, clauses, steps):
@@ -120,9 +124,14 @@ def grover(circuit, q, c, ancilla, clauses, steps):
         circuit (Circuit): circuit with the full grover algorithm applied.
     """
     circuit.add(start_grover(q, ancilla))
+    # Materialize the oracle and diffusion gate sequences once instead of
+    # re-running the generators (and re-building all gate objects) on each
+    # of the O(sqrt(2**qubits)) Grover iterations.
+    oracle_gates = list(oracle(q, c, ancilla, clauses))
+    diffusion_gates = list(diffusion(q))
     for i in range(steps):
-        circuit.add(oracle(q, c, ancilla, clauses))
-        circuit.add(diffusion(q))
+        circuit.add(oracle_gates)
+        circuit.add(diffusion_gates)
     circuit.add(gates.M(*(q), register_name='result'))
     return circuit
 
@@ -1,5 +1,5 @@
 #!/usr/bin/env python
-import numpy as np
+import math
 import functions
 import argparse
 
@@ -16,14 +16,15 @@ def main(nqubits, instance):
     control, solution, clauses = functions.read_file(nqubits, instance)
     qubits = control[0]
     clauses_num = control[1]
-    steps = int((np.pi/4)*np.sqrt(2**qubits))
+    steps = int((math.pi/4)*math.sqrt(2**qubits))
     print('Qubits encoding the solution: {}\n'.format(qubits))
     print('Total number of qubits used:  {}\n'.format(qubits + clauses_num + 1))
     q, c, ancilla, circuit = functions.create_qc(qubits, clauses_num)
     circuit = functions.grover(circuit, q, c, ancilla, clauses, steps)
     result = circuit(nshots=100)
     frequencies = result.frequencies(binary=True, registers=False)
-    most_common_bitstring = frequencies.most_common(1)[0][0]
+    # max is a single pass over the counter; most_common sorts all of it
+    most_common_bitstring = max(frequencies, key=frequencies.get)
     print('Most common bitstring: {}\n'.format(most_common_bitstring))
     if solution:
         print('Exact cover solution:  {}\n'.format(''.join(solution)))
@@ -75,6 +75,10 @@ class QSVD():
 
         Returns:
             qibo.tensorflow.circuit.TensorflowCircuit with the variational circuit for the QSVD
+
+        The ansatz circuit is built once during initialization and shared
+        across all cost-function evaluations; only its parameters are
+        updated here, so optimizer iterations do not rebuild any gates.
         """
         self._circuit.set_parameters(theta)
         return self._circuit
@@ -89,25 +93,19 @@ class QSVD():
         Returns:
             numpy.float32 with the value of the cost function for the QSVD with angles theta
         """
-        def Hamming(string1, string2):
-            """
-            Args:
-                two strings to be compared
-
-            Returns:
-                Hamming distance of the strings
-            """
-            return sum(q1 != q2 for q1, q2 in zip(string1, string2))
-
         Circuit_ansatz = self.QSVD_circuit(theta)
         result = Circuit_ansatz(init_state, nshots)
-        result = result.frequencies(binary=True)
+        samples = np.array(result.samples(binary=False), dtype=np.uint64)
 
-        loss = 0
-        for bit_string in result:
-            a = bit_string[:self.subsize2]
-            b = bit_string[self.subsize2:]
-            loss += Hamming(a, b) * result[bit_string]
+        # Split each integer sample in the two halves of the bipartition and
+        # count the differing bits with vectorized bit operations instead of
+        # comparing the measured bitstrings character by character in Python.
+        # The ansatz measures ``small`` qubits from each subsystem, so each
+        # sample holds ``2 * small`` bits.
+        small = min(self.subsize, self.subsize2)
+        a = samples >> np.uint64(small)
+        b = samples & np.uint64((1 << small) - 1)
+        loss = np.unpackbits((a ^ b).view(np.uint8)).sum()
         return loss/nshots
 
     def minimize(self, init_theta, init_state=None, nshots=100000,
@@ -140,20 +138,26 @@ class QSVD():
 
         Returns:
             numpy.array with the Schmidt coefficients given by the QSVD, in decreasing order
+
+        The diagonal outcomes are extracted from the integer form of the
+        samples, so no bitstring keys are ever built or looked up.
         """
         Qsvd = self.QSVD_circuit(theta)
         result = Qsvd(init_state, nshots)
 
-        result = result.frequencies(binary=True)
         small = min(self.subsize, self.subsize2)
-
-        Schmidt = []
-        for i in range(2**small):
-
-            bit_string = bin(i)[2:].zfill(small)
-            Schmidt.append(result[2*bit_string])
-
-        Schmidt = np.array(sorted(Schmidt, reverse=True))
+        samples = np.array(result.samples(binary=False), dtype=np.int64)
+
+        # Histogram the integer samples directly: keep the outcomes where
+        # both halves of the bipartition coincide and count them with
+        # np.bincount instead of generating all 2**small bitstrings and
+        # looking them up in a frequency dict.
+        mask = (1 << small) - 1
+        a = samples >> small
+        b = samples & mask
+        Schmidt = np.bincount(a[a == b], minlength=2**small)
+
+        Schmidt = np.sort(Schmidt)[::-1]
         Schmidt = np.sqrt(Schmidt / nshots)
 
         return Schmidt / np.linalg.norm(Schmidt)
@@ -171,6 +175,6 @@ class QSVD():
         Schmidt = self.Schmidt_coeff(theta, init_state, nshots=nshots)
         Schmidt = Schmidt**2
 
-        non_zero_coeff = np.array([coeff for coeff in Schmidt if coeff > tol])
+        non_zero_coeff = Schmidt[Schmidt > tol]
 
         return -np.sum(non_zero_coeff * np.log2(non_zero_coeff))
@@ -30,6 +30,15 @@ class Gate:
     """
     from qibo.abstractions import gates as module
 
+    # Store the fixed base attributes in slots so that the many gate
+    # instances allocated by large circuits keep them out of the per-gate
+    # ``__dict__``. Subclasses do not declare ``__slots__`` so they retain
+    # a (smaller) ``__dict__`` for their own attributes.
+    __slots__ = ("name", "is_controlled_by", "init_args", "init_kwargs",
+                 "_target_qubits", "_control_qubits", "_nqubits", "_nstates",
+                 "is_prepared", "well_defined", "_density_matrix",
+                 "_active_call")
+
     def __init__(self):
         self.name = None
         self.is_controlled_by = False
@@ -38,7 +47,7 @@ class Gate:
         self.init_kwargs = {}
 
         self._target_qubits = tuple()
-        self._control_qubits = set()
+        self._control_qubits = tuple()
 
         self._nqubits = None
         self._nstates = None
@@ -63,7 +72,7 @@ class Gate:
     @property
     def control_qubits(self) -> Tuple[int]:
         """Tuple with ids of control qubits sorted in increasing order."""
-        return tuple(sorted(self._control_qubits))
+        return self._control_qubits
 
     @property
     def qubits(self) -> Tuple[int]:
@@ -80,11 +89,17 @@ class Gate:
 
     def _set_control_qubits(self, qubits: Sequence[int]):
         """Helper method for setting control qubits."""
-        self._control_qubits = set(qubits)
-        if len(self._control_qubits) != len(qubits):
+        qubits = tuple(qubits)
+        if len(set(qubits)) != len(qubits):
             repeated = self._find_repeated(qubits)
             raise_error(ValueError, "Control qubit {} was given twice for gate {}."
                                     "".format(repeated, self.name))
+        # Sort once on assignment so that reading ``control_qubits`` is free.
+        # Controls are usually passed in increasing order, in which case a
+        # linear monotonicity scan lets us skip the sort altogether.
+        if any(q1 > q2 for q1, q2 in zip(qubits, qubits[1:])):
+            qubits = tuple(sorted(qubits))
+        self._control_qubits = qubits
 
     @target_qubits.setter
     def target_qubits(self, qubits: Sequence[int]):
@@ -121,7 +136,7 @@ class Gate:
 
     def _check_control_target_overlap(self):
         """Checks that there are no qubits that are both target and controls."""
-        common = set(self._target_qubits) & self._control_qubits
+        common = set(self._target_qubits).intersection(self._control_qubits)
         if common:
             raise_error(ValueError, "{} qubits are both targets and controls for "
                                     "gate {}.".format(common, self.name))
@@ -150,10 +165,15 @@ class Gate:
         or during `__call__` if the gate is called directly on a state.
         The user is not supposed to set `nqubits` by hand.
         """
-        if self._nqubits is not None and n != self.nqubits:
-            raise_error(ValueError, "Cannot set gate number of qubits to {} "
-                                    "because it is already set to {}."
-                                    "".format(n, self.nqubits))
+        if self._nqubits is not None:
+            if n != self._nqubits:
+                raise_error(ValueError, "Cannot set gate number of qubits to {} "
+                                        "because it is already set to {}."
+                                        "".format(n, self._nqubits))
+            # re-assignment to the same value is a no-op so that gates can
+            # be reused across identically sized circuits without redundant
+            # updates
+            return
         self._nqubits = n
         self._nstates = 2**n
 
@@ -75,6 +75,14 @@ class AbstractCircuit(ABC):
         nqubits (int): Total number of qubits in the circuit.
     """
 
+    # Keep the fixed base attributes in slots; backend circuit subclasses
+    # still carry a ``__dict__`` for their own attributes.
+    __slots__ = ("nqubits", "init_kwargs", "queue", "parametrized_gates",
+                 "trainable_gates", "is_executed", "measurement_tuples",
+                 "measurement_gate", "measurement_gate_result",
+                 "fusion_groups", "_final_state", "density_matrix",
+                 "repeated_execution", "param_tensor_types")
+
     def __init__(self, nqubits):
         if not isinstance(nqubits, int):
             raise_error(TypeError, "Number of qubits must be an integer but "
@@ -229,7 +237,7 @@ class AbstractCircuit(ABC):
         """
         import copy
         new_circuit = self.__class__(**self.init_kwargs)
-        for gate in self.queue[::-1]:
+        for gate in reversed(self.queue):
             new_circuit.add(gate.dagger())
         new_circuit.measurement_gate = copy.copy(self.measurement_gate)
         new_circuit.measurement_tuples = dict(self.measurement_tuples)
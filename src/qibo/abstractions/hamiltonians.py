@@ -78,6 +78,15 @@ class Hamiltonian(ABC):
         """
         return self.eigenvectors()[:, 0]
 
+    def ground_state_energy(self):
+        """Computes the ground state energy of the Hamiltonian.
+
+        Uses the ``eigenvalues`` method, which caches the spectrum, and
+        returns the lowest eigenvalue. Callers that only need this value
+        should prefer it over indexing ``eigenvalues()`` manually.
+        """
+        return self.eigenvalues()[0]
+
     @abstractmethod
     def exp(self, a): # pragma: no cover
         """Computes a tensor corresponding to exp(-1j * a * H).
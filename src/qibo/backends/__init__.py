@@ -1,4 +1,5 @@
 import os
+import functools
 from qibo import config
 from qibo.config import raise_error, log, warnings
 
@@ -6,36 +7,28 @@ from qibo.config import raise_error, log, warnings
 class Backend:
 
     def __init__(self):
-        self.available_backends = {}
+        self._available_backends = {}
         active_backend = "numpy"
 
         # check if numpy is installed
         if self.check_availability("numpy"):
             from qibo.backends.numpy import NumpyDefaultEinsumBackend, NumpyMatmulEinsumBackend
-            self.available_backends["numpy"] = NumpyDefaultEinsumBackend
-            self.available_backends["numpy_defaulteinsum"] = NumpyDefaultEinsumBackend
-            self.available_backends["numpy_matmuleinsum"] = NumpyMatmulEinsumBackend
+            self._available_backends["numpy"] = NumpyDefaultEinsumBackend
+            self._available_backends["numpy_defaulteinsum"] = NumpyDefaultEinsumBackend
+            self._available_backends["numpy_matmuleinsum"] = NumpyMatmulEinsumBackend
         else:  # pragma: no cover
             raise_error(ModuleNotFoundError, "Numpy is not installed.")
 
         # check if tensorflow is installed and use it as default backend.
         if self.check_availability("tensorflow"):
-            from qibo.backends.tensorflow import TensorflowDefaultEinsumBackend, TensorflowMatmulEinsumBackend
-            os.environ["TF_CPP_MIN_LOG_LEVEL"] = str(config.LOG_LEVEL)
-            import tensorflow as tf
-            self.available_backends["defaulteinsum"] = TensorflowDefaultEinsumBackend
-            self.available_backends["matmuleinsum"] = TensorflowMatmulEinsumBackend
-            self.available_backends["tensorflow_defaulteinsum"] = TensorflowDefaultEinsumBackend
-            self.available_backends["tensorflow_matmuleinsum"] = TensorflowMatmulEinsumBackend
-            import qibo.tensorflow.custom_operators as op
-            if not op._custom_operators_loaded: # pragma: no cover
-                log.warning("Einsum will be used to apply gates with Tensorflow. "
-                            "Removing custom operators from available backends.")
-                self.available_backends["tensorflow"] = TensorflowDefaultEinsumBackend
-            else:
-                from qibo.backends.tensorflow import TensorflowCustomBackend
-                self.available_backends["custom"] = TensorflowCustomBackend
-                self.available_backends["tensorflow"] = TensorflowCustomBackend
+            # Register lazy placeholders instead of importing Tensorflow
+            # here: the import dominates qibo's start-up time and is only
+            # required once a tensorflow backend is actually constructed.
+            for name in ("defaulteinsum", "matmuleinsum",
+                         "tensorflow_defaulteinsum",
+                         "tensorflow_matmuleinsum",
+                         "custom", "tensorflow"):
+                self._available_backends[name] = self._load_tensorflow
             active_backend = "tensorflow"
         else:  # pragma: no cover
             # case not tested because CI has tf installed
@@ -43,25 +36,66 @@ class Backend:
                         "Numpy does not support Qibo custom operators and GPU. "
                         "Einsum will be used to apply gates on CPU.")
             # use numpy for defaulteinsum and matmuleinsum backends
-            self.available_backends["defaulteinsum"] = NumpyDefaultEinsumBackend
-            self.available_backends["matmuleinsum"] = NumpyMatmulEinsumBackend
+            self._available_backends["defaulteinsum"] = NumpyDefaultEinsumBackend
+            self._available_backends["matmuleinsum"] = NumpyMatmulEinsumBackend
 
         self.constructed_backends = {}
         self._active_backend = None
         self.qnp = self.construct_backend("numpy_defaulteinsum")
-        # Create the default active backend
+        # The default active backend is only recorded here and constructed
+        # on first use so that ``import qibo`` does not pay the tensorflow
+        # import cost.
         if "QIBO_BACKEND" in os.environ: # pragma: no cover
-            self.active_backend = os.environ.get("QIBO_BACKEND")
-        self.active_backend = active_backend
+            active_backend = os.environ.get("QIBO_BACKEND")
+        self._default_backend = active_backend
+
+    @property
+    def available_backends(self):
+        """Maps backend names to the classes that implement them.
+
+        Accessing this resolves any lazy tensorflow placeholders so that
+        membership checks (for example for the custom operators) reflect
+        the backends that can actually be constructed.
+        """
+        if any(not isinstance(b, type)
+               for b in self._available_backends.values()):
+            self._load_tensorflow()
+        return self._available_backends
 
     @property
     def active_backend(self):
+        if self._active_backend is None:
+            self._active_backend = self.construct_backend(self._default_backend)
         return self._active_backend
 
     @active_backend.setter
     def active_backend(self, name):
         self._active_backend = self.construct_backend(name)
 
+    def _load_tensorflow(self):
+        """Imports the Tensorflow backends, replacing their lazy placeholders.
+
+        The import is deferred to the first construction of a tensorflow
+        backend so that numpy-only scripts do not pay its cost.
+        """
+        from qibo.backends.tensorflow import TensorflowDefaultEinsumBackend, TensorflowMatmulEinsumBackend
+        os.environ["TF_CPP_MIN_LOG_LEVEL"] = str(config.LOG_LEVEL)
+        import tensorflow as tf
+        self._available_backends["defaulteinsum"] = TensorflowDefaultEinsumBackend
+        self._available_backends["matmuleinsum"] = TensorflowMatmulEinsumBackend
+        self._available_backends["tensorflow_defaulteinsum"] = TensorflowDefaultEinsumBackend
+        self._available_backends["tensorflow_matmuleinsum"] = TensorflowMatmulEinsumBackend
+        import qibo.tensorflow.custom_operators as op
+        if not op._custom_operators_loaded: # pragma: no cover
+            log.warning("Einsum will be used to apply gates with Tensorflow. "
+                        "Removing custom operators from available backends.")
+            self._available_backends.pop("custom")
+            self._available_backends["tensorflow"] = TensorflowDefaultEinsumBackend
+        else:
+            from qibo.backends.tensorflow import TensorflowCustomBackend
+            self._available_backends["custom"] = TensorflowCustomBackend
+            self._available_backends["tensorflow"] = TensorflowCustomBackend
+
     def construct_backend(self, name):
         """Constructs and returns a backend.
 
@@ -76,18 +110,27 @@ class Backend:
             Backend object.
         """
         if name not in self.constructed_backends:
-            if name not in self.available_backends:
-                available = [" - {}: {}".format(n, b.description)
-                             for n, b in self.available_backends.items()]
+            entry = self._available_backends.get(name)
+            if entry is not None and not isinstance(entry, type):
+                # resolve the lazy tensorflow placeholders only when a
+                # tensorflow backend is actually requested
+                self._load_tensorflow()
+            if name not in self._available_backends:
+                # Describe placeholders without resolving them so that an
+                # unknown name does not trigger the tensorflow import.
+                available = [" - {}: {}".format(
+                                n, b.description if isinstance(b, type)
+                                else "Tensorflow backend.")
+                             for n, b in self._available_backends.items()]
                 available = "\n".join(available)
                 raise_error(ValueError, "Unknown backend {}. Please select one of "
                                         "the available backends:\n{}."
                                         "".format(name, available))
-            new_backend = self.available_backends.get(name)()
-            if self.active_backend is not None:
-                new_backend.set_precision(self.active_backend.precision)
-                if self.active_backend.device is not None:
-                    new_backend.set_device(self.active_backend.default_device)
+            new_backend = self._available_backends.get(name)()
+            if self._active_backend is not None:
+                new_backend.set_precision(self._active_backend.precision)
+                if self._active_backend.device is not None:
+                    new_backend.set_device(self._active_backend.default_device)
             self.constructed_backends[name] = new_backend
         return self.constructed_backends.get(name)
 
@@ -101,6 +144,7 @@ class Backend:
         return str(self)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def check_availability(module_name):
         """Check if module is installed.
 
@@ -110,8 +154,8 @@ class Backend:
         Returns:
             True if the module is installed, False otherwise.
         """
-        from pkgutil import iter_modules
-        return module_name in (name for _, name, _ in iter_modules())
+        from importlib.util import find_spec
+        return find_spec(module_name) is not None
 
 
 K = Backend()
@@ -1,6 +1,45 @@
+import functools
 import numpy as np
 
 
+@functools.lru_cache(maxsize=None)
+def _numpy_matrices(dtype):
+    """Allocates the fundamental gate matrices for the given dtype.
+
+    The arrays are created once per dtype and shared by all ``Matrices``
+    instances; ``backend.cast`` copies them when casting, so the cached
+    bank is never exposed for mutation.
+    """
+    matrices = {}
+    matrices["I"] = np.eye(2, dtype=dtype)
+    m = np.ones((2, 2), dtype=dtype)
+    m[1, 1] = -1
+    matrices["H"] = m / np.sqrt(2)
+    m = np.zeros((2, 2), dtype=dtype)
+    m[0, 1], m[1, 0] = 1, 1
+    matrices["X"] = m
+    m = np.zeros((2, 2), dtype=dtype)
+    m[0, 1], m[1, 0] = -1j, 1j
+    matrices["Y"] = m
+    m = np.eye(2, dtype=dtype)
+    m[1, 1] = -1
+    matrices["Z"] = m
+    m = np.eye(4, dtype=dtype)
+    m[2, 2], m[2, 3] = 0, 1
+    m[3, 2], m[3, 3] = 1, 0
+    matrices["CNOT"] = m
+    matrices["CZ"] = np.diag([1, 1, 1, -1]).astype(dtype)
+    m = np.eye(4, dtype=dtype)
+    m[1, 1], m[1, 2] = 0, 1
+    m[2, 1], m[2, 2] = 1, 0
+    matrices["SWAP"] = m
+    m = np.eye(8, dtype=dtype)
+    m[-2, -2], m[-2, -1] = 0, 1
+    m[-1, -2], m[-1, -1] = 1, 0
+    matrices["TOFFOLI"] = m
+    return matrices
+
+
 class Matrices:
 
     _NAMES = ["I", "H", "X", "Y", "Z", "CNOT", "CZ", "SWAP", "TOFFOLI"]
@@ -19,8 +58,9 @@ class Matrices:
         self.allocate_matrices()
 
     def allocate_matrices(self):
+        bank = _numpy_matrices(self.dtype)
         for name in self._NAMES:
-            getattr(self, f"_set{name}")()
+            setattr(self, f"_{name}", self.backend.cast(bank[name]))
 
     @property
     def dtype(self):
@@ -61,48 +101,3 @@ class Matrices:
     @property
     def TOFFOLI(self):
         return self._TOFFOLI
-
-    def _setI(self):
-        self._I = self.backend.cast(np.eye(2, dtype=self.dtype))
-
-    def _setH(self):
-        m = np.ones((2, 2), dtype=self.dtype)
-        m[1, 1] = -1
-        self._H = self.backend.cast(m / np.sqrt(2))
-
-    def _setX(self):
-        m = np.zeros((2, 2), dtype=self.dtype)
-        m[0, 1], m[1, 0] = 1, 1
-        self._X = self.backend.cast(m)
-
-    def _setY(self):
-        m = np.zeros((2, 2), dtype=self.dtype)
-        m[0, 1], m[1, 0] = -1j, 1j
-        self._Y = self.backend.cast(m)
-
-    def _setZ(self):
-        m = np.eye(2, dtype=self.dtype)
-        m[1, 1] = -1
-        self._Z = self.backend.cast(m)
-
-    def _setCNOT(self):
-        m = np.eye(4, dtype=self.dtype)
-        m[2, 2], m[2, 3] = 0, 1
-        m[3, 2], m[3, 3] = 1, 0
-        self._CNOT = self.backend.cast(m)
-
-    def _setCZ(self):
-        m = np.diag([1, 1, 1, -1])
-        self._CZ = self.backend.cast(m)
-
-    def _setSWAP(self):
-        m = np.eye(4, dtype=self.dtype)
-        m[1, 1], m[1, 2] = 0, 1
-        m[2, 1], m[2, 2] = 1, 0
-        self._SWAP = self.backend.cast(m)
-
-    def _setTOFFOLI(self):
-        m = np.eye(8, dtype=self.dtype)
-        m[-2, -2], m[-2, -1] = 0, 1
-        m[-1, -2], m[-1, -1] = 1, 0
-        self._TOFFOLI = self.backend.cast(m)
@@ -109,7 +109,9 @@ class Overlap(BackendCallback, abstract_callbacks.Overlap):
         self.statec = K.conj(K.cast(state, dtype='DTYPECPX'))
 
     def state_vector_call(self, state):
-        return K.abs(K.sum(self.statec * state))
+        # contract in a single fused call instead of materializing the
+        # elementwise product before the reduction
+        return K.abs(K.einsum("i,i->", self.statec, state))
 
     def density_matrix_call(self, state):
         raise_error(NotImplementedError, "Overlap callback is not implemented "
@@ -32,12 +32,13 @@ class Circuit(circuit.AbstractCircuit):
         self.state_cls = states.VectorState
 
     def set_nqubits(self, gate):
-        if gate._nqubits is not None and gate.nqubits != self.nqubits:
+        if gate._nqubits is None:
+            gate.nqubits = self.nqubits
+        elif gate.nqubits != self.nqubits:
             raise_error(RuntimeError, "Cannot add gate {} that acts on {} "
                                       "qubits to circuit that contains {}"
                                       "qubits.".format(
                                             gate, gate.nqubits, self.nqubits))
-        gate.nqubits = self.nqubits
 
     def _add_layer(self, gate):
         for unitary in gate.unitaries:
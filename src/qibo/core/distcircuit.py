@@ -64,6 +64,13 @@ class DistributedCircuit(circuit.Circuit):
         self.memory_device = memory_device
         self.calc_devices = accelerators
         self.queues = DistributedQueues(self, gate_module)
+        # Worker pool for device-parallel execution, created on the first
+        # gate group and kept alive for all subsequent groups.
+        self._device_pool = None
+
+    def __del__(self):
+        if getattr(self, "_device_pool", None) is not None:
+            self._device_pool.__exit__(None, None, None)
 
     def set_nqubits(self, gate):
         AbstractCircuit.set_nqubits(self, gate)
@@ -128,25 +135,33 @@ class DistributedCircuit(circuit.Circuit):
                 number of gates to be applied by accelerator ``i``.
         """
         def device_job(ids, device):
-            for i in ids:
-                with K.device(device):
+            # Enter the device context once per device instead of once per
+            # piece so that consecutive pieces assigned to the same device
+            # are processed without re-acquiring the placement scope.
+            with K.device(device):
+                for i in ids:
                     piece = self._device_job(state.pieces[i], queues[i])
                     state.pieces[i].assign(piece)
                     del(piece)
 
-        pool = joblib.Parallel(n_jobs=len(self.calc_devices),
-                               prefer="threads")
-        pool(joblib.delayed(device_job)(ids, device)
-             for device, ids in self.queues.device_to_ids.items())
+        if self._device_pool is None:
+            # Enter the pool as a managed context so that the same workers
+            # are reused by every gate group instead of spawning a fresh
+            # pool per group.
+            self._device_pool = joblib.Parallel(n_jobs=len(self.calc_devices),
+                                                prefer="threads")
+            self._device_pool.__enter__()
+        self._device_pool(joblib.delayed(device_job)(ids, device)
+                          for device, ids in self.queues.device_to_ids.items())
 
     def _swap(self, state, global_qubit: int, local_qubit: int):
         m = self.queues.qubits.reduced_global[global_qubit]
         m = self.nglobal - m - 1
         t = 1 << m
-        for g in range(self.ndevices // 2):
-            i = ((g >> m) << (m + 1)) + (g & (t - 1))
-            local_eff = self.queues.qubits.reduced_local[local_qubit]
-            with K.device(self.memory_device):
+        local_eff = self.queues.qubits.reduced_local[local_qubit]
+        with K.device(self.memory_device):
+            for g in range(self.ndevices // 2):
+                i = ((g >> m) << (m + 1)) + (g & (t - 1))
                 K.op.swap_pieces(state.pieces[i], state.pieces[i + t],
                                  local_eff, self.nlocal, get_threads())
 
@@ -26,9 +26,11 @@ class DistributedQubits:
         self.set = set(qubits)
         self.list = sorted(qubits)
         self.local = [q for q in range(nqubits) if q not in self.set]
-        self.reduced_global = {q: self.list.index(q) for q in self.list}
-        self.reduced_local = {q: q - self.reduction_number(q)
-                              for q in self.local}
+        # Both lists are sorted, so the reduced id of a qubit is simply its
+        # position in the corresponding list. Enumerating once avoids the
+        # quadratic ``list.index``/``reduction_number`` scans.
+        self.reduced_global = {q: i for i, q in enumerate(self.list)}
+        self.reduced_local = {q: i for i, q in enumerate(self.local)}
 
         self.transpose_order = self.list + self.local
         self.reverse_transpose_order = nqubits * [0]
@@ -81,6 +83,9 @@ class DistributedQueues:
         self.swaps_list = []
 
         self.device_to_ids = {d: v for d, v in self._ids(circuit.calc_devices)}
+        # Device piece indices used for the vectorized global-control masks
+        # in ``create``.
+        self._device_ids = K.np.arange(self.ndevices)
         self.ids_to_device = self.ndevices * [None]
         for device, ids in self.device_to_ids.items():
             for i in ids:
@@ -135,7 +140,22 @@ class DistributedQueues:
             yield device, list(range(start, stop))
             start = stop
 
-    def _create_device_gate(self, gate: gates.Gate) -> gates.Gate:
+    def _reduce_qubits(self, gate: gates.Gate) -> Tuple[Tuple[int], Tuple[int]]:
+        """Recomputes target and control indices considering only local qubits.
+
+        The reduced indices are the same for all devices, so they are
+        calculated once per gate and shared by all device copies.
+        """
+        new_target_qubits = tuple(q - self.qubits.reduction_number(q)
+                                  for q in gate.target_qubits)
+        new_control_qubits = tuple(q - self.qubits.reduction_number(q)
+                                   for q in gate.control_qubits
+                                   if q not in self.qubits.set)
+        return new_target_qubits, new_control_qubits
+
+    def _create_device_gate(self, gate: gates.Gate,
+                            target_qubits: Tuple[int],
+                            control_qubits: Tuple[int]) -> gates.Gate:
         """Creates a copy of a gate for specific device application.
 
         Target and control qubits are modified according to the local qubits of
@@ -143,19 +163,15 @@ class DistributedQueues:
 
         Args:
             gate: The :class:`qibo.abstractions.gates.Gate` object of the gate to copy.
+            target_qubits: Reduced target ids from ``_reduce_qubits``.
+            control_qubits: Reduced control ids from ``_reduce_qubits``.
 
         Returns:
             A :class:`qibo.abstractions.gates.Gate` object with the proper target and
             control qubit indices for device-specific application.
         """
         devgate = copy.copy(gate)
-        # Recompute the target/control indices considering only local qubits.
-        new_target_qubits = tuple(q - self.qubits.reduction_number(q)
-                                  for q in devgate.target_qubits)
-        new_control_qubits = tuple(q - self.qubits.reduction_number(q)
-                                   for q in devgate.control_qubits
-                                   if q not in self.qubits.set)
-        devgate.set_targets_and_controls(new_target_qubits, new_control_qubits)
+        devgate.set_targets_and_controls(target_qubits, control_qubits)
         devgate.original_gate = gate
         devgate.device_gates = set()
         return devgate
@@ -190,10 +206,11 @@ class DistributedQueues:
             global_targets = set(gate.target_qubits) & self.qubits.set
             accept = isinstance(gate, gates.SWAP) and len(global_targets) == 1
             accept = accept or not global_targets
-            for skipped_gate in new_remaining_queue:
-                accept = accept and skipped_gate.commutes(gate)
-                if not accept:
-                    break
+            if accept:
+                for skipped_gate in new_remaining_queue:
+                    if not skipped_gate.commutes(gate):
+                        accept = False
+                        break
             if accept:
                 queue.append(gate)
                 for q in gate.target_qubits:
@@ -213,8 +230,9 @@ class DistributedQueues:
             assert len(global_targets) == 2
             global_targets.remove(target_set.pop())
 
+        blocked_qubits = self.qubits.set | target_set
         available_swaps = (q for q in counter.argsort()
-                           if q not in self.qubits.set | target_set)
+                           if q not in blocked_qubits)
         qubit_map = {}
         for q in global_targets:
             qs = next(available_swaps)
@@ -296,24 +314,31 @@ class DistributedQueues:
                 if not self.queues or not self.queues[-1]:
                     self.queues.append([[] for _ in range(self.ndevices)])
 
+                # If there are control qubits that are global then the gate
+                # should not be applied by all devices. Compute the mask of
+                # active devices for all pieces at once with vectorized bit
+                # operations instead of re-scanning the controls per device.
+                global_controls = set(gate.control_qubits) & self.qubits.set
+                if global_controls:
+                    control_bits = K.np.array(
+                        [self.nglobal - self.qubits.reduced_global[q] - 1
+                         for q in global_controls], dtype=K.np.int64)
+                    active = K.np.all(
+                        (self._device_ids[:, None] >> control_bits) & 1,
+                        axis=1)
+                else:
+                    active = None
+
+                reduced_targets, reduced_controls = self._reduce_qubits(gate)
                 for device, ids in self.device_to_ids.items():
-                    devgate = self._create_device_gate(gate)
+                    devgate = self._create_device_gate(
+                        gate, reduced_targets, reduced_controls)
                     # Gate matrix should be constructed in the calculation
                     # device otherwise device parallelization will break
                     devgate.device = device
                     devgate.nqubits = self.nlocal
                     for i in ids:
-                        flag = True
-                        # If there are control qubits that are global then
-                        # the gate should not be applied by all devices
-                        for control in (set(gate.control_qubits) &
-                                        self.qubits.set):
-                            ic = self.qubits.list.index(control)
-                            ic = self.nglobal - ic - 1
-                            flag = bool((i // (2 ** ic)) % 2)
-                            if not flag:
-                                break
-                        if flag:
+                        if active is None or active[i]:
                             self.queues[-1][i].append(devgate)
                             if isinstance(gate, gates.ParametrizedGate):
                                 gate.device_gates.add(devgate)
@@ -37,13 +37,18 @@ class BackendGate(BaseBackendGate):
     @property
     def cache(self):
         if self._cache is None:
-            self._cache = K.create_gate_cache(self)
+            with K.device(self.device):
+                self._cache = K.create_gate_cache(self)
         return self._cache
 
     @property
     def matrix(self):
         if self._matrix is None:
-            self._matrix = self.calculate_matrix()
+            # Construct the matrix in the gate's device so that device
+            # copies used by distributed circuits keep their tensors in
+            # the calculation device they are applied on.
+            with K.device(self.device):
+                self._matrix = self.calculate_matrix()
         return self._matrix
 
     def calculate_matrix(self):
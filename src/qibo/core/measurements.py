@@ -318,15 +318,20 @@ class MeasurementRegistersResult:
             return self._calculate_register_samples()
 
         qubit_map = self.result.qubit_map
-        frequencies = self.result.frequencies(True)
+        nqubits = self.result.nqubits
+        frequencies = self.result.frequencies(False)
         results = {}
         for name, qubit_tuple in self.register_qubits.items():
+            # map each register qubit to (source bit, destination bit) so
+            # that register values are extracted with integer bit tests
+            # instead of indexing the binary string representation
+            shifts = [(nqubits - 1 - qubit_map[q], len(qubit_tuple) - i - 1)
+                      for i, q in enumerate(qubit_tuple)]
             register_freqs = collections.Counter()
-            for bitstring, freq in frequencies.items():
+            for res, freq in frequencies.items():
                 idx = 0
-                for i, q in enumerate(qubit_tuple):
-                    if int(bitstring[qubit_map[q]]):
-                        idx +=  2 ** (len(qubit_tuple) - i - 1)
+                for src, dst in shifts:
+                    idx += ((int(res) >> src) & 1) << dst
                 register_freqs[idx] += freq
             results[name] = MeasurementResult(qubit_tuple)
             results[name].set_frequencies(register_freqs)
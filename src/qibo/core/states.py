@@ -116,9 +116,10 @@ class VectorState(AbstractState):
         return self
 
     def expectation(self, hamiltonian, normalize=False):
-        statec = K.conj(self.tensor)
+        # contract the conjugate state with H|state> in a single einsum call
+        # to avoid materializing the elementwise product tensor
         hstate = hamiltonian @ self.tensor
-        ev = K.real(K.sum(statec * hstate))
+        ev = K.real(K.einsum("i,i->", K.conj(self.tensor), hstate))
         if normalize:
             norm = K.sum(K.square(K.abs(self.tensor)))
             ev = ev / norm
@@ -193,12 +194,13 @@ class DistributedState(VectorState):
         # the state pieces (created in ``self.create_pieces()``)
         self.pieces = None
 
-        # Dictionaries containing tensors that are useful for reshaping
-        # the state when splitting or merging the pieces.
+        # Plain tuples used for reshaping the state when splitting or
+        # merging the pieces. Tuples are treated as compile-time constants
+        # by the backends, unlike eager tensor shapes.
         n = self.nstates // 2 ** self.nglobal
         self.shapes = {
-            "full": K.cast((self.nstates,), dtype='DTYPEINT'),
-            "device": K.cast((self.ndevices, n), dtype='DTYPEINT'),
+            "full": (self.nstates,),
+            "device": (self.ndevices, n),
             "tensor": self.nqubits * (2,)
             }
 
@@ -241,11 +243,11 @@ class DistributedState(VectorState):
         """
         if self.qubits.list == list(range(self.nglobal)):
             with K.device(self.device):
-                state = K.concatenate([x[K.newaxis] for x in self.pieces], axis=0)
+                state = K.stack(self.pieces, axis=0)
                 state = K.reshape(state, self.shapes["full"])
         elif self.qubits.list == list(range(self.nlocal, self.nqubits)):
             with K.device(self.device):
-                state = K.concatenate([x[:, K.newaxis] for x in self.pieces], axis=1)
+                state = K.stack(self.pieces, axis=1)
                 state = K.reshape(state, self.shapes["full"])
         else: # fall back to the transpose op
             with K.device(self.device):
@@ -261,7 +263,7 @@ class DistributedState(VectorState):
                                          "efficiency.")
 
     def create_pieces(self):
-        n = 2 ** (self.nqubits - self.nglobal)
+        n = self.shapes["device"][1]
         with K.device(self.device):
             self.pieces = [K.optimization.Variable(K.zeros(n))
                            for _ in range(self.ndevices)]
@@ -276,13 +278,27 @@ class DistributedState(VectorState):
         if self.pieces is None:
             self.create_pieces()
         with K.device(self.device):
-            full_state = K.reshape(full_state, self.shapes["device"])
-            pieces = [full_state[i] for i in range(self.ndevices)]
-            new_state = K.zeros(self.shapes["device"])
-            new_state = K.transpose_state(pieces, new_state, self.nqubits,
-                                          self.qubits.transpose_order)
-            for i in range(self.ndevices):
-                self.pieces[i].assign(new_state[i])
+            # Mirror the fast paths of the ``tensor`` merge: when the global
+            # qubits are the leading or trailing indices the split is a plain
+            # reshape and the transpose op with its full-state scratch buffer
+            # can be skipped.
+            if self.qubits.list == list(range(self.nglobal)):
+                full_state = K.reshape(full_state, self.shapes["device"])
+                for i in range(self.ndevices):
+                    self.pieces[i].assign(full_state[i])
+            elif self.qubits.list == list(range(self.nlocal, self.nqubits)):
+                full_state = K.reshape(
+                    full_state, (self.shapes["device"][1], self.ndevices))
+                for i in range(self.ndevices):
+                    self.pieces[i].assign(full_state[:, i])
+            else: # fall back to the transpose op
+                full_state = K.reshape(full_state, self.shapes["device"])
+                pieces = [full_state[i] for i in range(self.ndevices)]
+                new_state = K.zeros(self.shapes["device"])
+                new_state = K.transpose_state(pieces, new_state, self.nqubits,
+                                              self.qubits.transpose_order)
+                for i in range(self.ndevices):
+                    self.pieces[i].assign(new_state[i])
 
     def __getitem__(self, key):
       """Implements indexing of the distributed state without the full vector."""
@@ -317,8 +333,9 @@ class DistributedState(VectorState):
       state = cls(circuit)
       state.create_pieces()
       with K.device(state.device):
-          piece = K.initial_state(nqubits=state.nlocal)
-          state.pieces[0] = K.optimization.Variable(piece, dtype=piece.dtype)
+          # write |00...0> into the existing variable instead of allocating
+          # a second variable for the first piece
+          state.pieces[0].assign(K.initial_state(nqubits=state.nlocal))
       return state
 
     @classmethod
@@ -6,9 +6,24 @@ from qibo.core.hamiltonians import Hamiltonian, SymbolicHamiltonian, TrotterHami
 
 def _build_spin_model(nqubits, matrix, condition):
     """Helper method for building nearest-neighbor spin model Hamiltonians."""
-    h = sum(SymbolicHamiltonian.multikron(
-      (matrix if condition(i, j) else matrices.I for j in range(nqubits)))
-            for i in range(nqubits))
+    h = 0
+    for i in range(nqubits):
+        # Group consecutive identity factors into a single ``eye`` block so
+        # that each term requires one kron per non-trivial site instead of
+        # one per qubit. This avoids materializing the intermediate
+        # Kronecker chain at every qubit of every term.
+        blocks, run = [], 0
+        for j in range(nqubits):
+            if condition(i, j):
+                if run:
+                    blocks.append(K.np.eye(2 ** run, dtype=matrix.dtype))
+                    run = 0
+                blocks.append(matrix)
+            else:
+                run += 1
+        if run:
+            blocks.append(K.np.eye(2 ** run, dtype=matrix.dtype))
+        h = h + SymbolicHamiltonian.multikron(blocks)
     return h
 
 
@@ -34,20 +49,39 @@ def XXZ(nqubits, delta=0.5, numpy=False, trotter=False):
             from qibo.hamiltonians import XXZ
             h = XXZ(3) # initialized XXZ model with 3 qubits
     """
+    hx = K.np.kron(matrices.X, matrices.X)
+    hy = K.np.kron(matrices.Y, matrices.Y)
+    hz = K.np.kron(matrices.Z, matrices.Z)
+    pair = hx + hy + delta * hz
     if trotter:
-        hx = K.np.kron(matrices.X, matrices.X)
-        hy = K.np.kron(matrices.Y, matrices.Y)
-        hz = K.np.kron(matrices.Z, matrices.Z)
-        term = Hamiltonian(2, hx + hy + delta * hz, numpy=True)
+        term = Hamiltonian(2, pair, numpy=True)
         terms = {(i, i + 1): term for i in range(nqubits - 1)}
         terms[(nqubits - 1, 0)] = term
         return TrotterHamiltonian.from_dictionary(terms)
 
-    condition = lambda i, j: i in {j % nqubits, (j+1) % nqubits}
-    hx = _build_spin_model(nqubits, matrices.X, condition)
-    hy = _build_spin_model(nqubits, matrices.Y, condition)
-    hz = _build_spin_model(nqubits, matrices.Z, condition)
-    matrix = hx + hy + delta * hz
+    if nqubits < 2:
+        # The pairwise construction below assumes at least two sites; for a
+        # single qubit fall back to the per-Pauli spin model build.
+        condition = lambda i, j: i in {j % nqubits, (j + 1) % nqubits}
+        hx = _build_spin_model(nqubits, matrices.X, condition)
+        hy = _build_spin_model(nqubits, matrices.Y, condition)
+        hz = _build_spin_model(nqubits, matrices.Z, condition)
+        return Hamiltonian(nqubits, hx + hy + delta * hz, numpy=numpy)
+
+    # Fuse the three Pauli passes into a single loop over sites: each
+    # nearest-neighbor pair contributes the precomputed two-site operator
+    # XX + YY + delta * ZZ at once instead of walking the Kronecker chain
+    # separately for every Pauli.
+    matrix = 0
+    for i in range(nqubits - 1):
+        matrix = matrix + SymbolicHamiltonian.multikron(
+            (K.np.eye(2 ** i, dtype=pair.dtype), pair,
+             K.np.eye(2 ** (nqubits - i - 2), dtype=pair.dtype)))
+    # The periodic term acts on the non-adjacent pair (nqubits - 1, 0) and
+    # has to be built per Pauli.
+    for m, coeff in ((matrices.X, 1), (matrices.Y, 1), (matrices.Z, delta)):
+        matrix = matrix + coeff * SymbolicHamiltonian.multikron(
+            (m, K.np.eye(2 ** (nqubits - 2), dtype=pair.dtype), m))
     return Hamiltonian(nqubits, matrix, numpy=numpy)
 
 
@@ -91,6 +91,7 @@ class Grover(object):
         self.num_sol = number_solutions
         self.targ_a = target_amplitude
         self.iterative = iterative
+        self._step_circuit = None
 
         self.space_sup = list(range(self.sup_qubits + self.anc_qubits_sup))
         self.space_ora = list(range(self.sup_qubits + self.anc_qubits_ora)) + [self.nqubits-1]
@@ -121,11 +122,18 @@ class Grover(object):
         return c
 
     def step(self):
-        """Combine oracle and diffusion for a Grover step."""
-        c = Circuit(self.nqubits)
-        c.add(self.oracle.on_qubits(*self.space_ora))
-        c.add(self.diffusion().on_qubits(*(self.space_sup+[self.nqubits-1])))
-        return c
+        """Combine oracle and diffusion for a Grover step.
+
+        The oracle and diffusion operators are fixed for the lifetime of the
+        model, so the combined step circuit is built once and reused by all
+        iterations and repeated ``circuit`` calls.
+        """
+        if self._step_circuit is None:
+            c = Circuit(self.nqubits)
+            c.add(self.oracle.on_qubits(*self.space_ora))
+            c.add(self.diffusion().on_qubits(*(self.space_sup+[self.nqubits-1])))
+            self._step_circuit = c
+        return self._step_circuit
 
     def circuit(self, iterations):
         """Creates circuit that performs Grover's algorithm with a set amount of iterations.